@@ -2,12 +2,10 @@ import asyncio
 import datetime
 import json
 import os
-import pyperclip
 from typing import Dict, List, Set
 
 import threading
-from src.api_server import start_api_server
-import time
+from src.api_server import API_READY, start_api_server
 
 import streamlit as st
 
@@ -24,27 +22,92 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-if "api_server_started" not in st.session_state:
-    api_thread = threading.Thread(target=start_api_server, daemon=True)
+# Process-wide singletons shared by every session and the API server
+@st.cache_resource
+def get_server_manager():
+    return ServerManager()
+
+
+@st.cache_resource
+def get_config():
+    return Configuration()
+
+
+@st.cache_resource
+def get_auth_manager():
+    return AuthManager()
+
+
+@st.cache_resource
+def get_api_client():
+    return ApiClient()
+
+
+@st.cache_resource
+def get_async_loop():
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+@st.cache_resource
+def _api_thread():
+    api_thread = threading.Thread(
+        target=start_api_server,
+        args=(get_auth_manager(), get_config(), get_server_manager()),
+        daemon=True
+    )
     api_thread.start()
-    time.sleep(1)
-    st.session_state.api_server_started = True
+    API_READY.wait(timeout=2)
+    return api_thread
+
 
-# Initialize session state for persistent objects
-if "server_manager" not in st.session_state:
-    st.session_state.server_manager = ServerManager()
-if "config" not in st.session_state:
-    st.session_state.config = Configuration()
-if "auth_manager" not in st.session_state:
-    st.session_state.auth_manager = AuthManager()
-if "api_client" not in st.session_state:
-    st.session_state.api_client = ApiClient()
+_api_thread()
 
 
-# Function to copy text to clipboard
-def copy_to_clipboard(text):
-    pyperclip.copy(text)
-    return True
+# Function to run a coroutine on the persistent background event loop
+def run_async(coro):
+    return asyncio.run_coroutine_threadsafe(coro, get_async_loop()).result()
+
+
+@st.fragment
+def render_server_row(name, config):
+    # Reruns of this fragment only re-render this server's expander, so the
+    # state is read per row; a shared running set would be stale after one
+    is_running = get_server_manager().is_server_running(name)
+    status = "🟢 Running" if is_running else "🔴 Stopped"
+    with st.expander(f"{name} - {status}", expanded=is_running):
+        st.json(config)
+        if is_running and st.button(f"Stop {name}", key=f"stop_{name}"):
+            with st.spinner(f"Stopping {name}..."):
+                run_async(get_server_manager().stop_server(name))
+                st.toast(f"Server {name} stopped.")
+                st.rerun(scope="fragment")
+
+
+@st.fragment
+def render_key_row(key, details):
+    # A revoked key renders nothing on the fragment rerun that follows
+    if key not in get_auth_manager().get_all_keys():
+        return
+
+    created_time = datetime.datetime.fromtimestamp(details['created'])
+
+    with st.expander(f"API Key: {key[:10]}..."):
+        col1, col2 = st.columns([3, 1])
+
+        with col1:
+            st.code(key, language="bash")
+            st.write(f"🖥️ **Servers:** {', '.join(details['servers'])}")
+            st.write(f"📅 **Created:** {created_time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+        with col2:
+            if st.button("Revoke", key=f"revoke_{key[:8]}"):
+                if get_auth_manager().revoke_key(key):
+                    st.toast("API key revoked.")
+                    st.rerun(scope="fragment")
+                else:
+                    st.error("Failed to revoke API key.")
 
 
 # Page title and description
@@ -64,7 +127,7 @@ page = st.sidebar.radio(
 if page == "Server Dashboard":
     st.header("📋 Server Dashboard")
 
-    servers = st.session_state.config.get_servers()
+    servers = get_config().get_servers()
 
     if not servers:
         st.warning("No servers configured. Please add servers to your servers_config.json file.")
@@ -84,31 +147,15 @@ if page == "Server Dashboard":
         }
         st.code(json.dumps(sample_config, indent=2), language="json")
     else:
-        # Display running servers first
-        running_servers = st.session_state.server_manager.get_running_servers()
-        if running_servers:
-            st.subheader("🟢 Running Servers")
-            for name in running_servers:
-                with st.expander(f"{name}", expanded=True):
-                    st.json(st.session_state.config.get_server_config(name))
-                    if st.button(f"Stop {name}", key=f"stop_{name}"):
-                        with st.spinner(f"Stopping {name}..."):
-                            asyncio.run(st.session_state.server_manager.stop_server(name))
-                            st.success(f"Server {name} stopped.")
-                            st.rerun()
-
-        # Display all servers
         st.subheader("📃 All Configured Servers")
         for name, config in servers.items():
-            status = "🟢 Running" if st.session_state.server_manager.is_server_running(name) else "🔴 Stopped"
-            with st.expander(f"{name} - {status}"):
-                st.json(config)
+            render_server_row(name, config)
 
 # Launch Servers page
 elif page == "Launch Servers":
     st.header("🚀 Launch Server Group")
 
-    servers = st.session_state.config.get_servers()
+    servers = get_config().get_servers()
 
     if not servers:
         st.warning("No servers configured. Please add servers to your servers_config.json file.")
@@ -121,13 +168,13 @@ elif page == "Launch Servers":
             selected_servers = st.multiselect(
                 "Select servers to launch",
                 options=server_names,
-                default=list(st.session_state.server_manager.get_selected_servers()),
+                default=list(get_server_manager().get_selected_servers()),
                 help="Select the MCP servers you want to launch as a group"
             )
 
             # Update selected servers
             if selected_servers:
-                st.session_state.server_manager.select_servers(selected_servers)
+                get_server_manager().select_servers(selected_servers)
 
             # Launch button
             launch_button = st.button("Launch Selected Servers", type="primary", disabled=len(selected_servers) == 0)
@@ -135,25 +182,19 @@ elif page == "Launch Servers":
             if launch_button:
                 with st.spinner("Starting servers..."):
                     # Use asyncio to start servers
-                    started_servers = asyncio.run(
-                        st.session_state.server_manager.start_selected_servers(servers)
+                    started_servers = run_async(
+                        get_server_manager().start_selected_servers(servers)
                     )
 
                     if started_servers:
                         st.success(f"Started servers: {', '.join(started_servers)}")
 
                         # Generate API key for the started servers
-                        api_key = st.session_state.auth_manager.generate_key(started_servers)
+                        api_key = get_auth_manager().generate_key(started_servers)
 
                         # Display the API key
                         st.subheader("🔑 Generated API Key")
-                        key_col1, key_col2 = st.columns([5, 1])
-                        with key_col1:
-                            st.code(api_key, language="bash")
-                        with key_col2:
-                            if st.button("Copy", key="copy_api_key"):
-                                copy_to_clipboard(api_key)
-                                st.success("Copied to clipboard!")
+                        st.code(api_key, language="bash")
 
                         # Instructions for using the API key
                         st.subheader("How to Use the API Key")
@@ -184,7 +225,7 @@ elif page == "Launch Servers":
                 "💡 **Tip:**\n\nStarting servers as a group allows you to generate a single API key for all of them.")
 
     # Display running servers
-    running_servers = st.session_state.server_manager.get_running_servers()
+    running_servers = get_server_manager().get_running_servers()
     if running_servers:
         st.subheader("🟢 Currently Running Servers")
         st.write(", ".join(running_servers))
@@ -192,7 +233,7 @@ elif page == "Launch Servers":
         # Stop all servers button
         if st.button("Stop All Servers", type="secondary"):
             with st.spinner("Stopping all servers..."):
-                asyncio.run(st.session_state.server_manager.stop_all_servers())
+                run_async(get_server_manager().stop_all_servers())
                 st.success("All servers stopped.")
                 st.rerun()
 
@@ -200,7 +241,7 @@ elif page == "Launch Servers":
 elif page == "API Keys Management":
     st.header("🔑 API Keys Management")
 
-    keys = st.session_state.auth_manager.get_all_keys()
+    keys = get_auth_manager().get_all_keys()
 
     if not keys:
         st.info("No API keys have been generated yet. Launch a server group to generate an API key.")
@@ -208,28 +249,8 @@ elif page == "API Keys Management":
         st.markdown("Below are the API keys you've generated for your MCP server groups.")
 
         # Display all keys
-        for key, details in keys.items():
-            created_time = datetime.datetime.fromtimestamp(details['created'])
-
-            with st.expander(f"API Key: {key[:10]}..."):
-                col1, col2 = st.columns([3, 1])
-
-                with col1:
-                    st.code(key, language="bash")
-                    st.write(f"🖥️ **Servers:** {', '.join(details['servers'])}")
-                    st.write(f"📅 **Created:** {created_time.strftime('%Y-%m-%d %H:%M:%S')}")
-
-                with col2:
-                    if st.button("Copy", key=f"copy_{key[:8]}"):
-                        copy_to_clipboard(key)
-                        st.success("Copied to clipboard!")
-
-                    if st.button("Revoke", key=f"revoke_{key[:8]}"):
-                        if st.session_state.auth_manager.revoke_key(key):
-                            st.success("API key revoked.")
-                            st.rerun()
-                        else:
-                            st.error("Failed to revoke API key.")
+        for key, details in list(keys.items()):
+            render_key_row(key, details)
 
 # Footer
 st.markdown("---")
@@ -1,14 +1,16 @@
 import uvicorn
-from fastapi import FastAPI, HTTPException, Depends, Header
+from fastapi import FastAPI, HTTPException, Depends, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Dict, List, Optional
 import socket
+import threading
 
 from .auth import AuthManager
 from .server import ServerManager
 from .config import Configuration
 
 API_PORT = None
+API_READY = threading.Event()
 
 app = FastAPI()
 
@@ -20,21 +22,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-auth_manager = AuthManager()
-config = Configuration()
-server_manager = ServerManager()
 
-
-async def verify_api_key(authorization: str = Header(None)):
+async def verify_api_key(request: Request, authorization: str = Header(None)):
     if not authorization:
         raise HTTPException(status_code=401, detail="API key required")
 
-    if authorization.startswith("Bearer "):
-        api_key = authorization[7:]
-    else:
-        api_key = authorization
+    api_key = authorization.removeprefix("Bearer ").strip()
 
-    is_valid, server_names = auth_manager.validate_key(api_key)
+    is_valid, server_names = request.app.state.auth_manager.validate_key(api_key)
     if not is_valid:
         raise HTTPException(status_code=401, detail="Invalid API key")
 
@@ -42,25 +37,24 @@ async def verify_api_key(authorization: str = Header(None)):
 
 
 @app.get("/api/servers")
-async def get_servers(server_names: List[str] = Depends(verify_api_key)):
-    servers_config = config.get_servers()
-
-    authorized_servers = []
-    for name in server_names:
-        if name in servers_config:
-            sse_port = 3000 + hash(name) % 1000
+async def get_servers(request: Request, server_names: List[str] = Depends(verify_api_key)):
+    server_manager = request.app.state.server_manager
+    port_map = server_manager.port_map
 
-            authorized_servers.append({
+    return {
+        "success": True,
+        "servers": [
+            {
                 "name": name,
                 "transport": {
                     "type": "sse",
-                    "url": f"http://0.0.0.0:{sse_port}/sse"
+                    "url": f"http://0.0.0.0:{port_map[name]}/sse"
                 }
-            })
-
-    return {
-        "success": True,
-        "servers": authorized_servers
+            }
+            # port_map keeps entries of crashed servers until they are stopped
+            for name in server_names
+            if name in port_map and server_manager.is_server_running(name)
+        ]
     }
 
 
@@ -69,25 +63,47 @@ async def health_check():
     return {"status": "ok"}
 
 
-def find_free_port(start_port=8000, max_attempts=100):
-    for port in range(start_port, start_port + max_attempts):
+def find_free_port(start_port=8000):
+    # Prefer the conventional port, otherwise let the kernel pick one
+    for port in (start_port, 0):
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
                 s.bind(('127.0.0.1', port))
-                return port
+                return s.getsockname()[1]
         except OSError:
             continue
     raise IOError("No free ports found")
 
 
-def start_api_server(host="0.0.0.0", port=None):
+class _ReadyServer(uvicorn.Server):
+    """Uvicorn server that sets API_READY once its socket is listening."""
+
+    async def startup(self, sockets=None):
+        await super().startup(sockets=sockets)
+        # Startup handlers run before the bind, so only trust `started`
+        if self.started:
+            API_READY.set()
+
+
+def start_api_server(
+        auth_manager: AuthManager,
+        config: Configuration,
+        server_manager: ServerManager,
+        host="0.0.0.0",
+        port=None
+):
+    app.state.auth_manager = auth_manager
+    app.state.config = config
+    app.state.server_manager = server_manager
+
     if port is None:
         port = find_free_port()
     print(f"Starting API server on port {port}")
     global API_PORT
     API_PORT = port
-    uvicorn.run(app, host=host, port=port)
+    _ReadyServer(uvicorn.Config(app, host=host, port=port)).run()
 
 
 if __name__ == "__main__":
-    start_api_server()
+    start_api_server(AuthManager(), Configuration(), ServerManager())
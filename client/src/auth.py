@@ -1,42 +1,98 @@
-import json
 import os
 import secrets
 import time
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Any, BinaryIO, Dict, List, Optional, Set, Tuple, Union
+
+import orjson
 
 
 class AuthManager:
     """Manages API keys and server access."""
 
-    def __init__(self, keys_file: str = "api_keys.json") -> None:
+    def __init__(self, keys_file: str = "api_keys.log") -> None:
         """Initialize the authentication manager.
 
         Args:
-            keys_file: Path to the API keys file
+            keys_file: Path to the append-only API keys log
         """
         self.keys_file = keys_file
+        self._log: Optional[BinaryIO] = None
+        self._log_records = 0
+        self._mtime = 0.0
+        self._migrate_legacy_keys()
         self.keys = self.load_keys()
 
+        # Compact the log if it is dominated by stale records
+        if self._log_records > 10 * max(len(self.keys), 1):
+            self.save_keys()
+
+    def _migrate_legacy_keys(self) -> None:
+        """Replay keys from the old api_keys.json into the log once."""
+        legacy_file = os.path.join(os.path.dirname(self.keys_file), "api_keys.json")
+        if os.path.exists(self.keys_file) or not os.path.exists(legacy_file):
+            return
+        try:
+            with open(legacy_file, "rb") as f:
+                self.keys = orjson.loads(f.read())
+            self.save_keys()
+            print(f"Migrated {len(self.keys)} API keys from {legacy_file}")
+        except Exception as e:
+            print(f"Error migrating API keys: {e}")
+
     def load_keys(self) -> Dict[str, Dict[str, Union[List[str], int]]]:
-        """Load API keys from the JSON file.
+        """Load API keys by replaying the append-only log.
 
         Returns:
             Dictionary of API keys and their associated servers
         """
+        keys: Dict[str, Dict[str, Union[List[str], int]]] = {}
+        records = 0
+        self._mtime = 0.0
         try:
             if os.path.exists(self.keys_file):
-                with open(self.keys_file, "r") as f:
-                    return json.load(f)
-            return {}
+                self._mtime = os.path.getmtime(self.keys_file)
+                with open(self.keys_file, "rb") as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        record = orjson.loads(line)
+                        records += 1
+                        if record["op"] == "add":
+                            keys[record["k"]] = record["v"]
+                        elif record["op"] == "del":
+                            keys.pop(record["k"], None)
         except Exception as e:
             print(f"Error loading API keys: {e}")
-            return {}
+        self._log_records = records
+        return keys
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Append a single record to the API keys log.
+
+        Args:
+            record: Log record to append
+        """
+        try:
+            if self._log is None:
+                self._log = open(self.keys_file, "ab", buffering=65536)
+            self._log.write(orjson.dumps(record) + b"\n")
+            self._log.flush()
+            self._log_records += 1
+        except Exception as e:
+            print(f"Error saving API keys: {e}")
 
     def save_keys(self) -> None:
-        """Save API keys to the JSON file."""
+        """Compact the API keys log to one record per live key."""
         try:
-            with open(self.keys_file, "w") as f:
-                json.dump(self.keys, f, indent=2)
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+            tmp_file = f"{self.keys_file}.tmp"
+            with open(tmp_file, "wb", buffering=1 << 18) as f:
+                for token, details in self.keys.items():
+                    f.write(orjson.dumps({"op": "add", "k": token, "v": details}) + b"\n")
+            os.replace(tmp_file, self.keys_file)
+            self._log_records = len(self.keys)
         except Exception as e:
             print(f"Error saving API keys: {e}")
 
@@ -53,13 +109,14 @@ class AuthManager:
         token = secrets.token_urlsafe(32)
 
         # Store the key with associated servers and creation time
-        self.keys[token] = {
+        details = {
             "servers": server_names,
             "created": int(time.time())
         }
+        self.keys[token] = details
 
-        # Save the updated keys
-        self.save_keys()
+        # Record the new key in the log
+        self._append({"op": "add", "k": token, "v": details})
 
         return token
 
@@ -72,10 +129,13 @@ class AuthManager:
         Returns:
             Tuple of (is_valid, server_names)
         """
-        # print(f"current keys: {self.keys}")
-        self.keys = self.load_keys()
-        # print(f"current keys after reload: {self.keys}")
-        # print(f"validating key: {key}")
+        # Only reload when the log was changed on disk since the last load
+        try:
+            mtime = os.path.getmtime(self.keys_file)
+        except FileNotFoundError:
+            mtime = 0.0
+        if mtime != self._mtime:
+            self.keys = self.load_keys()
 
         if key in self.keys:
             return True, self.keys[key]["servers"]
@@ -92,7 +152,7 @@ class AuthManager:
         """
         if key in self.keys:
             del self.keys[key]
-            self.save_keys()
+            self._append({"op": "del", "k": key})
             return True
         return False
 
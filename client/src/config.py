@@ -1,7 +1,7 @@
-import json
 import os
 from typing import Any, Dict, Optional
 
+import orjson
 from dotenv import load_dotenv
 
 
@@ -15,6 +15,7 @@ class Configuration:
             config_path: Path to the configuration file
         """
         self.config_path = config_path
+        self._mtime = 0.0
         self.load_env()
         self.config = self.load_config()
 
@@ -35,8 +36,10 @@ class Configuration:
         try:
             path = file_path or self.config_path
             if os.path.exists(path):
-                with open(path, "r") as f:
-                    return json.load(f)
+                if path == self.config_path:
+                    self._mtime = os.path.getmtime(path)
+                with open(path, "rb") as f:
+                    return orjson.loads(f.read())
             return {"mcpServers": {}}
         except Exception as e:
             print(f"Error loading configuration: {e}")
@@ -49,12 +52,23 @@ class Configuration:
             config: Configuration dictionary to save
         """
         try:
-            with open(self.config_path, "w") as f:
-                json.dump(config, f, indent=2)
+            # Keep indentation since servers_config.json is edited by hand
+            with open(self.config_path, "wb", buffering=1 << 18) as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+            self._mtime = os.path.getmtime(self.config_path)
             self.config = config
         except Exception as e:
             print(f"Error saving configuration: {e}")
 
+    def _refresh(self) -> None:
+        """Reload the configuration if the file was changed on disk."""
+        try:
+            mtime = os.path.getmtime(self.config_path)
+        except FileNotFoundError:
+            mtime = 0.0
+        if mtime != self._mtime:
+            self.config = self.load_config()
+
     def get_server_config(self, server_name: str) -> Optional[Dict[str, Any]]:
         """Get configuration for a specific server.
 
@@ -64,6 +78,7 @@ class Configuration:
         Returns:
             Server configuration or None if not found
         """
+        self._refresh()
         return self.config.get("mcpServers", {}).get(server_name)
 
     def get_servers(self) -> Dict[str, Dict[str, Any]]:
@@ -72,4 +87,5 @@ class Configuration:
         Returns:
             Dictionary of server configurations
         """
+        self._refresh()
         return self.config.get("mcpServers", {})
@@ -0,0 +1,38 @@
+import socket
+import zlib
+
+SSE_BASE_PORT = 3000
+SSE_PORT_RANGE = 1000
+
+
+def port_for(name: str) -> int:
+    """Get the default SSE port for a server.
+
+    Unlike the builtin hash(), crc32 is stable across interpreter runs, so
+    the same server name always maps to the same port.
+
+    Args:
+        name: Server name
+
+    Returns:
+        Default SSE port for the server
+    """
+    return SSE_BASE_PORT + zlib.crc32(name.encode()) % SSE_PORT_RANGE
+
+
+def is_port_free(port: int, host: str = "0.0.0.0") -> bool:
+    """Check whether a port can be bound.
+
+    Args:
+        port: Port to check
+        host: Host interface to bind on
+
+    Returns:
+        True if the port is free, False otherwise
+    """
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind((host, port))
+            return True
+    except OSError:
+        return False
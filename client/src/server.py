@@ -2,13 +2,37 @@ import asyncio
 import json
 import os
 import shutil
-import subprocess
 from contextlib import AsyncExitStack
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+from .ports import SSE_BASE_PORT, SSE_PORT_RANGE, is_port_free, port_for
+
+
+_which_cache: Dict[str, str] = {}
+
+
+def _which(cmd: str) -> Optional[str]:
+    """Resolve a command on PATH, caching the result for the app lifetime.
+
+    Misses are not cached, so a command installed while the app is
+    running is found on the next attempt.
+
+    Args:
+        cmd: Command name to resolve
+
+    Returns:
+        Full path to the command or None if not found
+    """
+    path = _which_cache.get(cmd)
+    if path is None:
+        path = shutil.which(cmd)
+        if path is not None:
+            _which_cache[cmd] = path
+    return path
+
 
 class Server:
     """Manages an MCP server connection and execution."""
@@ -22,28 +46,37 @@ class Server:
         """
         self.name: str = name
         self.config: Dict[str, Any] = config
-        self.process: Optional[subprocess.Popen] = None
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.sse_port: Optional[int] = None
         self.session: Optional[ClientSession] = None
         self._cleanup_lock: asyncio.Lock = asyncio.Lock()
         self.exit_stack: AsyncExitStack = AsyncExitStack()
 
-    async def start(self) -> bool:
-        """Start the server process via mcp-proxy in SSE mode."""
+    async def start(self, sse_port: Optional[int] = None) -> bool:
+        """Start the server process via mcp-proxy in SSE mode.
+
+        Args:
+            sse_port: SSE port to serve on; defaults to the stable port for the server name
+
+        Returns:
+            True if the server was started successfully, False otherwise
+        """
         if self.process and self.is_running():
             print(f"Server {self.name} is already running")
             return True
 
         try:
             # Prepare command and environment for mcp-proxy
-            proxy_command = shutil.which("mcp-proxy")
+            proxy_command = _which("mcp-proxy")
             if not proxy_command:
                 print(f"Command 'mcp-proxy' not found. Please install it.")
                 return False
 
             # Define the SSE port for this server
-            sse_port = self.config.get("sse_port", 3000 + hash(self.name) % 1000)
+            if sse_port is None:
+                sse_port = self.config.get("sse_port", port_for(self.name))
 
-            start_command = shutil.which(self.config["command"])
+            start_command = _which(self.config["command"])
             print(f"start command: {start_command}")
             if not start_command:
                 print(f"Command {self.config['command']} not found. Please install Node.js and npm.")
@@ -62,16 +95,18 @@ class Server:
             if "env" in self.config:
                 env.update(self.config["env"])
 
-            # Start mcp-proxy process
-            self.process = subprocess.Popen(
-                [proxy_command] + args,
+            # Start mcp-proxy process; its output is discarded since nothing
+            # reads it and a full pipe would block the child on write
+            self.process = await asyncio.create_subprocess_exec(
+                proxy_command,
+                *args,
                 env=env,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=False
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
             )
 
+            self.sse_port = sse_port
             print(f"Started mcp-proxy for {self.name} on port {sse_port}")
             return True
 
@@ -91,15 +126,22 @@ class Server:
             return True
 
         try:
-            self.process.terminate()
-
-            # Wait for the process to terminate
-            try:
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.process.kill()
+            # A process that already exited (e.g. crashed) only needs forgetting
+            if self.process.returncode is None:
+                try:
+                    self.process.terminate()
+
+                    # Wait for the process to terminate
+                    try:
+                        await asyncio.wait_for(self.process.wait(), 5.0)
+                    except asyncio.TimeoutError:
+                        self.process.kill()
+                        await self.process.wait()
+                except ProcessLookupError:
+                    pass
 
             self.process = None
+            self.sse_port = None
             print(f"Stopped server {self.name}")
             return True
 
@@ -126,7 +168,7 @@ class Server:
             return False
 
         # Check if the process is still alive
-        if self.process.poll() is not None:
+        if self.process.returncode is not None:
             # Process has terminated
             self.process = None
             return False
@@ -141,6 +183,7 @@ class ServerManager:
         """Initialize the server manager."""
         self.servers: Dict[str, Server] = {}
         self.selected_servers: Set[str] = set()
+        self.port_map: Dict[str, int] = {}
 
     def select_servers(self, server_names: List[str]) -> None:
         """Select a group of servers.
@@ -158,12 +201,62 @@ class ServerManager:
         """
         return self.selected_servers
 
-    async def start_server(self, name: str, config: Dict[str, Any]) -> bool:
+    def _claimed_ports(self, exclude: Optional[str] = None) -> Set[int]:
+        """Get the SSE ports held by running servers.
+
+        Args:
+            exclude: Server name whose port should not be counted
+
+        Returns:
+            Set of ports in use by other running servers
+        """
+        return {
+            port for name, port in self.port_map.items()
+            if name != exclude and self.is_server_running(name)
+        }
+
+    def assign_port(self, name: str, config: Dict[str, Any], claimed: Set[int]) -> int:
+        """Pick the SSE port for a server that is about to start.
+
+        Ports must be chosen before the servers are launched concurrently:
+        mcp-proxy binds its port only after the spawn returns, so probing
+        alone cannot tell two servers of the same batch apart.
+
+        Args:
+            name: Server name
+            config: Server configuration
+            claimed: Ports already taken; the chosen port is added to it
+
+        Returns:
+            SSE port for the server
+        """
+        if name in self.port_map and self.is_server_running(name):
+            port = self.port_map[name]
+        elif "sse_port" in config:
+            port = config["sse_port"]
+        else:
+            port = port_for(name)
+            # Walk forward on collision with another server or process
+            for _ in range(SSE_PORT_RANGE):
+                if port not in claimed and is_port_free(port):
+                    break
+                port = SSE_BASE_PORT + (port - SSE_BASE_PORT + 1) % SSE_PORT_RANGE
+
+        claimed.add(port)
+        return port
+
+    async def start_server(
+            self,
+            name: str,
+            config: Dict[str, Any],
+            sse_port: Optional[int] = None
+    ) -> bool:
         """Start an MCP server.
 
         Args:
             name: Server name
             config: Server configuration
+            sse_port: SSE port assigned by assign_port; assigned here if omitted
 
         Returns:
             True if the server was started successfully, False otherwise
@@ -171,7 +264,14 @@ class ServerManager:
         if name not in self.servers:
             self.servers[name] = Server(name, config)
 
-        return await self.servers[name].start()
+        if sse_port is None:
+            sse_port = self.assign_port(name, config, self._claimed_ports(exclude=name))
+
+        server = self.servers[name]
+        success = await server.start(sse_port)
+        if success:
+            self.port_map[name] = server.sse_port
+        return success
 
     async def start_selected_servers(self, server_configs: Dict[str, Dict[str, Any]]) -> List[str]:
         """Start all selected servers.
@@ -184,17 +284,32 @@ class ServerManager:
         """
         started_servers = []
 
+        names = []
         for name in self.selected_servers:
             if name in server_configs:
-                success = await self.start_server(name, server_configs[name])
-                if success:
-                    print(f"Success in starting server {name}")
-                    started_servers.append(name)
-                else:
-                    print(f"Failed to start server {name}")
+                names.append(name)
             else:
                 print(f"Server {name} not found in configuration")
 
+        # Assign every port up front so servers of this batch cannot collide
+        claimed = self._claimed_ports()
+        ports = [self.assign_port(name, server_configs[name], claimed) for name in names]
+
+        results = await asyncio.gather(
+            *(
+                self.start_server(name, server_configs[name], port)
+                for name, port in zip(names, ports)
+            ),
+            return_exceptions=True
+        )
+
+        for name, result in zip(names, results):
+            if result is True:
+                print(f"Success in starting server {name}")
+                started_servers.append(name)
+            else:
+                print(f"Failed to start server {name}")
+
         return started_servers
 
     async def stop_server(self, name: str) -> bool:
@@ -210,12 +325,12 @@ class ServerManager:
             print(f"Server {name} not found")
             return False
 
+        self.port_map.pop(name, None)
         return await self.servers[name].stop()
 
     async def stop_all_servers(self) -> None:
         """Stop all servers."""
-        for name in list(self.servers.keys()):
-            await self.stop_server(name)
+        await asyncio.gather(*(self.stop_server(name) for name in list(self.servers.keys())))
 
     def get_running_servers(self) -> List[str]:
         """Get names of all running servers.
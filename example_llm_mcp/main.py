@@ -1,15 +1,43 @@
 import asyncio
-import json
+import logging
 import os
+import random
 import shutil
+import sys
 from contextlib import AsyncExitStack
-from typing import Any, Union
-
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Mapping, Sequence, Union
+
+import httpx
+import orjson
+from aioconsole import ainput
 from dotenv import load_dotenv
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
-from openai import OpenAI, ChatCompletion
+from openai import AsyncOpenAI, ChatCompletion
+from openai.types.chat import (
+    ChatCompletionChunk,
+    ChatCompletionMessage,
+    ChatCompletionMessageToolCall,
+)
+from openai.types.chat.chat_completion import Choice
+from openai.types.chat.chat_completion_message_tool_call import Function
+
+log = logging.getLogger("pocket_mcp")
+
+# The system message and tool schemas form the prompt prefix sent on every turn.
+# Keep them byte-identical across turns so the provider's prompt cache can be reused:
+# any change here, even whitespace, invalidates the cached prefix.
+SYSTEM_MESSAGE = "You are a helpful assistant with access to some tools. Use them only when necessary."
+
+
+@lru_cache(maxsize=None)
+def _which(cmd: str) -> str | None:
+    # Absolute paths are returned unchanged if they are executable
+    return shutil.which(cmd)
 
 
 class Configuration:
@@ -18,6 +46,8 @@ class Configuration:
     def __init__(self) -> None:
         self.load_env()
         self.api_key = os.getenv("OPENAI_API_KEY")
+        # Snapshot of the environment shared by all servers
+        self.base_env: Mapping[str, str] = MappingProxyType(dict(os.environ))
 
     @staticmethod
     def load_env() -> None:
@@ -25,8 +55,8 @@ class Configuration:
 
     @staticmethod
     def load_config(file_path: str = "servers_config.json") -> dict[str, Any]:
-        with open(file_path, "r") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
 
     @property
     def llm_api_key(self) -> str:
@@ -38,27 +68,38 @@ class Configuration:
 class Server:
     """Manages MCP server connections and tool execution."""
 
-    def __init__(self, name: str, config: dict[str, Any]) -> None:
+    __slots__ = (
+        "name",
+        "config",
+        "base_env",
+        "stdio_context",
+        "session",
+        "_cleanup_lock",
+        "exit_stack",
+        "tool_names",
+    )
+
+    def __init__(
+            self, name: str, config: dict[str, Any], base_env: Mapping[str, str] | None = None
+    ) -> None:
         self.name: str = name
         self.config: dict[str, Any] = config
+        self.base_env: Mapping[str, str] = base_env if base_env is not None else os.environ
         self.stdio_context: Any | None = None
         self.session: ClientSession | None = None
         self._cleanup_lock: asyncio.Lock = asyncio.Lock()
         self.exit_stack: AsyncExitStack = AsyncExitStack()
+        self.tool_names: frozenset[str] = frozenset()
 
     async def initialize(self) -> None:
-        command = (
-            shutil.which("npx")
-            if self.config["command"] == "npx"
-            else self.config["command"]
-        )
+        command = _which(self.config["command"])
         if command is None:
             raise ValueError("The command must be a valid string and cannot be None.")
 
         server_params = StdioServerParameters(
             command=command,
             args=self.config["args"],
-            env={**os.environ, **self.config["env"]}
+            env={**self.base_env, **self.config["env"]}
             if self.config.get("env")
             else None,
         )
@@ -73,7 +114,7 @@ class Server:
             await session.initialize()
             self.session = session
         except Exception as e:
-            print(f"Error initializing server {self.name}: {e}")
+            log.error(f"Error initializing server {self.name}: {e}")
             await self.cleanup()
             raise
 
@@ -89,6 +130,7 @@ class Server:
                 for tool in item[1]:
                     tools.append(Tool(tool.name, tool.description, tool.inputSchema))
 
+        self.tool_names = frozenset(tool.name for tool in tools)
         return tools
 
     async def execute_tool(
@@ -97,27 +139,49 @@ class Server:
             arguments: dict[str, Any],
             retries: int = 2,
             delay: float = 1.0,
+            max_delay: float = 8.0,
+            deadline: float = 10.0,
+            attempt_timeout: float | None = None,
     ) -> Any:
         if not self.session:
             raise RuntimeError(f"Server {self.name} not initialized")
+        if self.tool_names and tool_name not in self.tool_names:
+            raise ValueError(f"Tool {tool_name} is not provided by server {self.name}")
 
+        loop = asyncio.get_running_loop()
+        started = loop.time()
         attempt = 0
         while attempt < retries:
             try:
-                print(f"Executing tool {tool_name}")
-                result = await self.session.call_tool(tool_name, arguments)
+                log.info(f"Executing tool {tool_name}")
+                # The deadline only bounds retries; long-running tools are not cut off
+                if attempt_timeout is None:
+                    result = await self.session.call_tool(tool_name, arguments)
+                else:
+                    try:
+                        result = await asyncio.wait_for(
+                            self.session.call_tool(tool_name, arguments), timeout=attempt_timeout
+                        )
+                    except TimeoutError:
+                        raise TimeoutError(
+                            f"Tool {tool_name} timed out after {attempt_timeout:g} seconds"
+                        ) from None
 
                 return result
 
             except Exception as e:
                 attempt += 1
-                print(f"Error executing tool: {e}. Attempt {attempt} of {retries}.")
-                if attempt < retries:
-                    print(f"Retrying in {delay} seconds...")
-                    await asyncio.sleep(delay)
-                else:
-                    print("Max retries reached. Failing.")
+                log.warning(f"Error executing tool: {e}. Attempt {attempt} of {retries}.")
+                # Exponential backoff with full jitter, bounded by the overall deadline
+                backoff = min(max_delay, delay * 2 ** (attempt - 1)) * random.random()
+                if attempt >= retries:
+                    log.error("Max retries reached. Failing.")
+                    raise
+                if loop.time() - started + backoff > deadline:
+                    log.error("Retry deadline exceeded. Failing.")
                     raise
+                log.info(f"Retrying in {backoff:.2f} seconds...")
+                await asyncio.sleep(backoff)
 
     async def cleanup(self) -> None:
         async with self._cleanup_lock:
@@ -126,55 +190,65 @@ class Server:
                 self.session = None
                 self.stdio_context = None
             except Exception as e:
-                print(f"Error during cleanup of server {self.name}: {e}")
+                log.warning(f"Error during cleanup of server {self.name}: {e}")
 
 
+@dataclass(slots=True)
 class Tool:
     """Represents a tool with its properties and formatting."""
 
-    def __init__(
-            self, name: str, description: str, input_schema: dict[str, Any]
-    ) -> None:
-        self.name: str = name
-        self.description: str = description
-        self.input_schema: dict[str, Any] = input_schema
-
-    def format_for_llm(self, provider_with_func_call: bool = False) -> str | dict:
-        if provider_with_func_call:
-            return {
-                "type": "function",
-                "function": {
-                    "name": self.name,
-                    "description": self.description,
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            param_name: param_info
-                            for param_name, param_info in self.input_schema["properties"].items()
-                        } if "properties" in self.input_schema else {},
-                        "required": self.input_schema.get("required", []),
-                        "additionalProperties": self.input_schema.get("additionalProperties", False)
-                    }
+    name: str
+    description: str
+    input_schema: dict[str, Any]
+    # Slots rule out cached_property, so the formatted forms are memoized here
+    _schema: dict | None = field(default=None, init=False, repr=False, compare=False)
+    _text: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def schema(self) -> dict:
+        if self._schema is not None:
+            return self._schema
+
+        properties = self.input_schema.get("properties", {})
+        self._schema = {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": self.description,
+                "parameters": {
+                    "type": "object",
+                    "properties": dict(properties),
+                    "required": list(self.input_schema.get("required", ())),
+                    "additionalProperties": self.input_schema.get("additionalProperties", False)
                 }
             }
-        else:
-            args_desc = []
+        }
+        return self._schema
 
-            if "properties" in self.input_schema:
-                for param_name, param_info in self.input_schema["properties"].items():
-                    arg_desc = (
-                        f"- {param_name}: {param_info.get('description', 'No description')}"
-                    )
-                    if param_name in self.input_schema.get("required", []):
-                        arg_desc += " (required)"
-                    args_desc.append(arg_desc)
+    @property
+    def text(self) -> str:
+        if self._text is not None:
+            return self._text
 
-            return f"""
+        properties = self.input_schema.get("properties", {})
+        required = frozenset(self.input_schema.get("required", ()))
+        args_desc = []
+
+        for param_name, param_info in properties.items():
+            arg_desc = (
+                f"- {param_name}: {param_info.get('description', 'No description')}"
+            )
+            if param_name in required:
+                arg_desc += " (required)"
+            args_desc.append(arg_desc)
+
+        self._text = f"""
 Tool: {self.name}
 Description: {self.description}
 Arguments:
 {chr(10).join(args_desc)}
 """
+        return self._text
 
 
 class LLMClient:
@@ -182,18 +256,38 @@ class LLMClient:
 
     def __init__(self, api_key: str = os.getenv("OPENAI_API_KEY")) -> None:
         self.api_key: str = api_key
-        self.client = OpenAI(api_key=self.api_key)
+        # One pooled HTTP/2 client so turns reuse the TLS connection
+        self._http = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
+        self.client = AsyncOpenAI(api_key=self.api_key, http_client=self._http)
 
-    def get_response(
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def get_response(
             self,
             messages: list[dict[str, str]],
             temperature: float = 0.3,
             model: str = "gpt-4o",
             max_tokens: int = 4096,
-            tools: list[dict[str, Any]] | None = None,
-    ) -> Union[str, ChatCompletion]:
+            tools: Sequence[dict[str, Any]] | None = None,
+            stream: bool = False,
+    ) -> Union[str, ChatCompletion, AsyncIterator[ChatCompletionChunk]]:
+        if stream:
+            return await self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                **({"tools": tools} if tools else {}),
+            )
+
         if tools:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=model,
                 messages=messages,
                 temperature=temperature,
@@ -206,7 +300,7 @@ class LLMClient:
             else:
                 return response.choices[0].message.content
         else:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=model,
                 messages=messages,
                 temperature=temperature,
@@ -222,100 +316,249 @@ class ChatSession:
     def __init__(self, servers: list[Server], llm_client: LLMClient) -> None:
         self.servers: list[Server] = servers
         self.llm_client: LLMClient = llm_client
+        self._tool_to_server: dict[str, Server] = {}
+        self._summary_task: asyncio.Task | None = None
+        self._warmup_tasks: list[asyncio.Task] = []
+
+    def trim_messages(self, messages: list[dict[str, Any]], max_turns: int = 20) -> None:
+        # Keep the system message, the running summary if any and the last turns
+        head = 2 if len(messages) > 1 and messages[1].get("name") == "summary" else 1
+        body = messages[head:]
+        if len(body) <= 2 * max_turns:
+            return
+
+        # Cut back to half the limit in one step, so a single summary covers
+        # many turns and the summary message stays stable in between.
+        # Never start the window in the middle of a tool call exchange
+        cut = len(body) - max_turns
+        while cut < len(body) - 1 and body[cut]["role"] != "user":
+            cut += 1
+
+        dropped = body[:cut]
+        del messages[head:head + cut]
+        self._summary_task = asyncio.create_task(
+            self.summarize_messages(messages, dropped, self._summary_task)
+        )
+
+    async def summarize_messages(
+            self,
+            messages: list[dict[str, Any]],
+            dropped: list[dict[str, Any]],
+            previous: asyncio.Task | None,
+    ) -> None:
+        if previous is not None:
+            await previous
+
+        has_summary = len(messages) > 1 and messages[1].get("name") == "summary"
+        transcript = "\n".join(
+            f"{message['role']}: {message.get('content') or ''}" for message in dropped
+        )
+        if has_summary:
+            transcript = f"{messages[1]['content']}\n{transcript}"
+
+        try:
+            summary = await self.llm_client.get_response([
+                {"role": "system", "content": "Summarize this conversation in a few sentences."},
+                {"role": "user", "content": transcript},
+            ])
+        except Exception as e:
+            log.warning(f"Failed to summarize conversation: {e}")
+            return
+
+        summary_message = {"role": "system", "name": "summary", "content": summary}
+        if has_summary:
+            messages[1] = summary_message
+        else:
+            messages.insert(1, summary_message)
 
     async def cleanup_servers(self) -> None:
-        cleanup_tasks = []
-        for server in self.servers:
-            cleanup_tasks.append(asyncio.create_task(server.cleanup()))
+        if self._summary_task is not None:
+            self._summary_task.cancel()
+            await asyncio.gather(self._summary_task, return_exceptions=True)
+            self._summary_task = None
 
-        if cleanup_tasks:
-            try:
-                await asyncio.gather(*cleanup_tasks, return_exceptions=True)
-            except Exception as e:
-                print(f"Warning during final cleanup: {e}")
+        # Server.cleanup logs and swallows its own errors, so one failing
+        # server does not cancel the cleanup of the others
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for server in self.servers:
+                    tg.create_task(server.cleanup())
+        except Exception as e:
+            log.warning(f"Error during final cleanup: {e}")
+
+        await self.llm_client.aclose()
+
+    async def finish_warmups(self) -> None:
+        if self._warmup_tasks:
+            await asyncio.gather(*self._warmup_tasks, return_exceptions=True)
+            self._warmup_tasks = []
+
+    async def consume_stream(self, stream: AsyncIterator[ChatCompletionChunk]) -> Union[str, ChatCompletion]:
+        await self.finish_warmups()
+        warmed: set[str] = set()
+        content_parts = []
+        tool_calls: dict[int, dict[str, str]] = {}
+        finish_reason = None
+        last_chunk = None
+
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            last_chunk = chunk
+            choice = chunk.choices[0]
+            delta = choice.delta
+
+            if delta.content:
+                sys.stdout.write(delta.content)
+                sys.stdout.flush()
+                content_parts.append(delta.content)
+
+            for tool_call in delta.tool_calls or []:
+                entry = tool_calls.setdefault(tool_call.index, {"id": "", "name": "", "arguments": ""})
+                if tool_call.id:
+                    entry["id"] = tool_call.id
+                if tool_call.function:
+                    entry["name"] += tool_call.function.name or ""
+                    entry["arguments"] += tool_call.function.arguments or ""
+
+                # Ping the target server while the arguments are still streaming
+                server = self._tool_to_server.get(entry["name"])
+                if server is not None and server.session and server.name not in warmed:
+                    warmed.add(server.name)
+                    self._warmup_tasks.append(asyncio.create_task(server.session.send_ping()))
+
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+
+        sys.stdout.write("\n")
+        content = "".join(content_parts)
+
+        if finish_reason != "tool_calls":
+            return content
+
+        # Rebuild a regular completion so process_llm_response handles it as before
+        return ChatCompletion(
+            id=last_chunk.id,
+            created=last_chunk.created,
+            model=last_chunk.model,
+            object="chat.completion",
+            choices=[
+                Choice(
+                    index=0,
+                    finish_reason="tool_calls",
+                    message=ChatCompletionMessage(
+                        role="assistant",
+                        content=content or None,
+                        tool_calls=[
+                            ChatCompletionMessageToolCall(
+                                id=entry["id"],
+                                type="function",
+                                function=Function(name=entry["name"], arguments=entry["arguments"]),
+                            )
+                            for _, entry in sorted(tool_calls.items())
+                        ],
+                    ),
+                )
+            ],
+        )
+
+    async def execute_tool_call(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        server = self._tool_to_server.get(tool_name)
+        if server is None:
+            raise RuntimeError(f"Tool {tool_name} not found on any server")
 
-    async def process_llm_response(self, llm_response: Union[str, ChatCompletion]) -> str | list:
+        result = await server.execute_tool(tool_name, arguments)
+
+        if isinstance(result, dict) and "progress" in result:
+            progress = result["progress"]
+            total = result["total"]
+            percentage = (progress / total) * 100
+            log.info(f"Progress: {progress}/{total} ({percentage:.1f}%)")
+
+        return result
+
+    async def process_llm_response(
+            self, llm_response: Union[str, ChatCompletion]
+    ) -> tuple[bool, str | list]:
         try:
             if isinstance(llm_response, str):
-                tool_call = json.loads(llm_response)
+                tool_call = orjson.loads(llm_response)
                 if "tool" in tool_call and "arguments" in tool_call:
-                    print(f"Executing tool: {tool_call['tool']}")
-                    print(f"With arguments: {tool_call['arguments']}")
-
-                    for server in self.servers:
-                        tools = await server.list_tools()
-                        if any(tool.name == tool_call["tool"] for tool in tools):
-                            try:
-                                result = await server.execute_tool(
-                                    tool_call["tool"], tool_call["arguments"]
-                                )
-
-                                if isinstance(result, dict) and "progress" in result:
-                                    progress = result["progress"]
-                                    total = result["total"]
-                                    percentage = (progress / total) * 100
-                                    print(f"Progress: {progress}/{total} ({percentage:.1f}%)")
-
-                                return f"Tool execution result: {result}"
-                            except Exception as e:
-                                error_msg = f"Error executing tool: {str(e)}"
-                                print(error_msg)
-                                return error_msg
-                return llm_response
+                    log.info(f"Executing tool: {tool_call['tool']}")
+                    log.info(f"With arguments: {tool_call['arguments']}")
+
+                    if tool_call["tool"] in self._tool_to_server:
+                        try:
+                            result = await self.execute_tool_call(
+                                tool_call["tool"], tool_call["arguments"]
+                            )
+                            return True, f"Tool execution result: {result}"
+                        except Exception as e:
+                            error_msg = f"Error executing tool: {str(e)}"
+                            log.error(error_msg)
+                            return True, error_msg
+                return False, llm_response
             else:
                 if llm_response.choices[0].finish_reason == "tool_calls":
+                    calls = []
                     for tool_call in llm_response.choices[0].message.tool_calls:
-                        function_call = json.loads(tool_call.function.to_json())
-                        if "arguments" in function_call and "name" in function_call:
-                            function_name = function_call["name"]
-                            arguments = json.loads(function_call["arguments"])
-                            print(f"Executing function: {function_name} with arguments: {arguments}")
-                            results = []
-
-                            for server in self.servers:
-                                tools = await server.list_tools()
-                                if any(tool.name == function_name for tool in tools):
-                                    try:
-                                        result = await server.execute_tool(
-                                            function_name, arguments
-                                        )
-
-                                        if isinstance(result, dict) and "progress" in result:
-                                            progress = result["progress"]
-                                            total = result["total"]
-                                            percentage = (progress / total) * 100
-                                            print(f"Progress: {progress}/{total} ({percentage:.1f}%)")
-
-                                        results.append(f"Tool execution result: {result}")
-                                    except Exception as e:
-                                        error_msg = f"Error executing tool: {str(e)}"
-                                        print(error_msg)
-                                        results.append(error_msg)
-
-                            return results
-
-            return llm_response
-        except json.JSONDecodeError:
-            return llm_response
+                        function_name = tool_call.function.name
+                        arguments = orjson.loads(tool_call.function.arguments)
+                        log.info(f"Executing function: {function_name} with arguments: {arguments}")
+                        calls.append((function_name, arguments))
+
+                    # Run all tool calls of the turn concurrently, keeping their order
+                    await self.finish_warmups()
+                    outcomes = await asyncio.gather(
+                        *(self.execute_tool_call(name, arguments) for name, arguments in calls),
+                        return_exceptions=True,
+                    )
+
+                    results = []
+                    for outcome in outcomes:
+                        if isinstance(outcome, Exception):
+                            error_msg = f"Error executing tool: {str(outcome)}"
+                            log.error(error_msg)
+                            results.append(error_msg)
+                        else:
+                            results.append(f"Tool execution result: {outcome}")
+
+                    return True, results
+
+            return False, llm_response
+        except orjson.JSONDecodeError:
+            return False, llm_response
 
     async def start(self) -> None:
         try:
-            for server in self.servers:
-                try:
-                    await server.initialize()
-                except Exception as e:
-                    print(f"Failed to initialize server: {e}")
-                    await self.cleanup_servers()
-                    return
+            results = await asyncio.gather(
+                *(server.initialize() for server in self.servers), return_exceptions=True
+            )
+            initialized = []
+            for server, result in zip(self.servers, results):
+                if isinstance(result, Exception):
+                    # Server.initialize has already cleaned up after itself
+                    log.error(f"Failed to initialize server {server.name}: {result}")
+                else:
+                    initialized.append(server)
+            self.servers = initialized
 
-            all_tools = []
+            if not self.servers:
+                log.error("No servers could be initialized")
+                return
+
+            # Tool lists are fetched once per session and indexed by tool name
+            tool_lists = await asyncio.gather(*(server.list_tools() for server in self.servers))
+            all_tools = [tool for tools in tool_lists for tool in tools]
+            self._tool_to_server = {}
             for server in self.servers:
-                tools = await server.list_tools()
-                all_tools.extend(tools)
+                for tool_name in server.tool_names:
+                    # On duplicate tool names the first server wins
+                    self._tool_to_server.setdefault(tool_name, server)
 
-            tools_schema = [tool.format_for_llm(provider_with_func_call=True) for tool in all_tools]
+            tools_schema = tuple(tool.schema for tool in all_tools)
 
-            # tools_description = "\n".join([tool.format_for_llm() for tool in all_tools])
+            # tools_description = "\n".join([tool.text for tool in all_tools])
             #
             # system_message = (
             #     "You are a helpful assistant with access to these tools:\n\n"
@@ -339,28 +582,30 @@ class ChatSession:
             #     "Please use only the tools that are explicitly defined above."
             # )
 
-            system_message = "You are a helpful assistant with access to some tools. Use them only when necessary."
-
-            messages = [{"role": "system", "content": system_message}]
+            # messages[0] is never edited, see SYSTEM_MESSAGE
+            messages = [{"role": "system", "content": SYSTEM_MESSAGE}]
 
             while True:
                 try:
-                    user_input = input("You: ").strip().lower()
+                    user_input = (await ainput("You: ")).strip().lower()
                     if user_input in ["quit", "exit"]:
                         print("\nExiting...")
                         break
 
                     messages.append({"role": "user", "content": user_input})
+                    self.trim_messages(messages)
 
                     # llm_response = self.llm_client.get_response(messages)
-                    llm_response = self.llm_client.get_response(messages, tools=tools_schema)
-                    print("\nAssistant: %s", llm_response)
+                    print("\nAssistant: ", end="", flush=True)
+                    llm_response = await self.consume_stream(
+                        await self.llm_client.get_response(messages, tools=tools_schema, stream=True)
+                    )
 
-                    result = await self.process_llm_response(llm_response)
+                    handled, result = await self.process_llm_response(llm_response)
 
-                    if isinstance(result, list) or result != llm_response:
-                        print(f"\nTool execution result: {result}")
-                        tool_call_output = json.loads(llm_response.choices[0].message.to_json())
+                    if handled:
+                        log.info(f"Tool execution result: {result}")
+                        tool_call_output = orjson.loads(llm_response.choices[0].message.to_json())
                         messages.append(tool_call_output)
                         messages[-1]['content'] = ""
 
@@ -382,8 +627,10 @@ class ChatSession:
                         # messages.append({"role": "assistant", "content": llm_response})
                         # messages.append({"role": "system", "content": result})
 
-                        final_response = self.llm_client.get_response(messages)
-                        print("\nFinal response: %s", final_response)
+                        print("\nFinal response: ", end="", flush=True)
+                        final_response = await self.consume_stream(
+                            await self.llm_client.get_response(messages, stream=True)
+                        )
                         messages.append(
                             {"role": "assistant", "content": final_response}
                         )
@@ -403,7 +650,7 @@ async def main() -> None:
     config = Configuration()
     server_config = config.load_config("servers_config.json")
     servers = [
-        Server(name, srv_config)
+        Server(name, srv_config, config.base_env)
         for name, srv_config in server_config["mcpServers"].items()
     ]
     llm_client = LLMClient(config.llm_api_key)
@@ -412,4 +659,7 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    # Keep third-party INFO logs (e.g. httpx requests) out of the chat output
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    log.setLevel(logging.INFO)
     asyncio.run(main())
\ No newline at end of file